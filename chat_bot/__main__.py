@@ -1,33 +1,104 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
+from chat_bot.batcher import PromptBatcher
 from chat_bot.config import Config
 from chat_bot.logger import logger
 from chat_bot.question_answering import QAModel
+from chat_bot.question_answering.response import Response
+
+# Bound the number of in-flight model calls so a request burst cannot
+# exhaust memory; the async endpoint keeps the event loop free meanwhile.
+MAX_WORKER_THREADS = 8
+# Prompts arriving within the wait window are merged into one LLM call.
+MAX_BATCH_SIZE = 8
+MAX_BATCH_WAIT_MS = 20
 
 config = Config()
-app = FastAPI()
-qa_model = QAModel(
-    llm_model_id=config.question_answering_model_id,
-    embedding_model_id=config.embedding_model_id,
-    index_repo_id=config.index_repo_id,
-    api_token=config.huggingface_token,
-    use_docs_for_context=config.use_docs_for_context,
-    add_sources_to_response=config.add_sources_to_response,
-    use_messages_for_context=config.use_messages_in_context,
-    num_relevant_docs=config.num_relevant_docs,
-    debug=config.debug,
-)
+executor = ThreadPoolExecutor(max_workers=MAX_WORKER_THREADS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # build the model at server startup rather than module import, so a
+    # bare import (tests, tooling, --reload supervisor) stays cheap
+    qa_model = QAModel(
+        llm_model_id=config.question_answering_model_id,
+        embedding_model_id=config.embedding_model_id,
+        index_repo_id=config.index_repo_id,
+        api_token=config.huggingface_token,
+        use_docs_for_context=config.use_docs_for_context,
+        add_sources_to_response=config.add_sources_to_response,
+        use_messages_for_context=config.use_messages_in_context,
+        num_relevant_docs=config.num_relevant_docs,
+        index_factory=config.faiss_index_factory,
+        faiss_on_gpu=config.faiss_on_gpu,
+        debug=config.debug,
+    )
+    app.state.qa_model = qa_model
+    app.state.batcher = None
+    batcher_task = None
+    if hasattr(qa_model.llm_model, "batched_call"):
+        app.state.batcher = PromptBatcher(
+            qa_model.llm_model,
+            max_batch_size=MAX_BATCH_SIZE,
+            max_wait_ms=MAX_BATCH_WAIT_MS,
+            executor=executor,
+        )
+        batcher_task = asyncio.create_task(app.state.batcher.run())
+    yield
+    if batcher_task is not None:
+        batcher_task.cancel()
+    executor.shutdown(wait=False)
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/chat")
-def get_answer(question: str, messages_context: str = ""):
+async def get_answer(request: Request, question: str, messages_context: str = ""):
+    qa_model = request.app.state.qa_model
+    batcher = request.app.state.batcher
     logger.info(
-        f"Received request with question: {question}" f"and context: {messages_context}"
+        "Received request with question: %s and context: %s",
+        question,
+        messages_context,
     )
-    response = qa_model.get_answer(question=question, messages_context=messages_context)
+    loop = asyncio.get_running_loop()
+    if batcher is not None:
+        cache_key = qa_model.answer_cache_key(question, messages_context)
+        response = qa_model.answer_cache.get(cache_key)
+        if response is None:
+            prompt = await loop.run_in_executor(
+                executor,
+                lambda: qa_model.get_prompt(
+                    question=question, messages_context=messages_context
+                ),
+            )
+            response = Response()
+            response.set_answer(await batcher.submit(prompt))
+            qa_model.answer_cache.put(cache_key, response)
+    else:
+        response = await qa_model.aget_answer(
+            question=question, messages_context=messages_context
+        )
     return {"answer": response.get_answer(), "sources": response.get_sources_as_text()}
 
 
+@app.get("/cache_stats")
+async def cache_stats(request: Request):
+    return request.app.state.qa_model.cache_stats()
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=int(config.port))
+    uvicorn.run(
+        "chat_bot.__main__:app",
+        host="0.0.0.0",
+        port=int(config.port),
+        loop="uvloop",
+        http="httptools",
+    )
@@ -0,0 +1,54 @@
+import asyncio
+
+
+class PromptBatcher:
+    """
+    Aggregates prompts from concurrent requests into a single batched LLM
+    call and scatters the answers back to the awaiting requests.
+
+    Args:
+        llm: Model exposing batched_call(prompts), returning one answer
+        per prompt in order.
+        max_batch_size (int): Maximum prompts merged into one call.
+        max_wait_ms (int): How long to wait for more prompts after the
+        first one arrives.
+        executor: Executor used for the blocking batched_call; None uses
+        the event loop's default executor.
+    """
+
+    def __init__(self, llm, max_batch_size: int, max_wait_ms: int, executor=None):
+        self.llm = llm
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def submit(self, prompt: str) -> str:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((prompt, future))
+        return await future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                answers = await loop.run_in_executor(
+                    self.executor, self.llm.batched_call, prompts
+                )
+            except Exception as err:
+                for _, future in batch:
+                    future.set_exception(err)
+                continue
+            for (_, future), answer in zip(batch, answers):
+                future.set_result(answer)
@@ -30,6 +30,8 @@ class Config:
     add_sources_to_response: bool = eval(get_env("ADD_SOURCES_TO_RESPONSE", "True"))
     use_messages_in_context: bool = eval(get_env("USE_MESSAGES_IN_CONTEXT", "True"))
     num_relevant_docs: bool = eval(get_env("NUM_RELEVANT_DOCS", 3))
+    faiss_index_factory: str = get_env("FAISS_INDEX_FACTORY", "HNSW32,SQfp16")
+    faiss_on_gpu: bool = eval(get_env("FAISS_ON_GPU", "False"))
     debug: bool = eval(get_env("DEBUG", "True"))
     port: str = eval(get_env("PORT", "5000"))
 
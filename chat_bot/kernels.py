@@ -0,0 +1,40 @@
+"""
+Numeric kernels for the hot Python loops around splitting and retrieval.
+
+When numba is installed the functions below are JIT-compiled to native
+code (set NUMBA_CACHE_DIR to persist the compiled artifacts across
+restarts); otherwise the plain Python definitions are used as-is.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def utf8_len(text: str) -> int:
+    """Length function passed to the text splitter."""
+    return len(text)
+
+
+def cosine_topk(query: np.ndarray, vectors: np.ndarray, k: int) -> np.ndarray:
+    """Returns the indices of the k rows of vectors most cosine-similar
+    to the query, best first."""
+    n = vectors.shape[0]
+    scores = np.empty(n, dtype=np.float32)
+    q_norm = np.sqrt(np.dot(query, query))
+    for i in prange(n):
+        row = vectors[i]
+        norm = np.sqrt(np.dot(row, row)) * q_norm
+        if norm == 0.0:
+            scores[i] = 0.0
+        else:
+            scores[i] = np.dot(query, row) / norm
+    return np.argsort(scores)[::-1][:k]
+
+
+if njit is not None:
+    utf8_len = njit(cache=True)(utf8_len)
+    cosine_topk = njit(parallel=True, cache=True)(cosine_topk)
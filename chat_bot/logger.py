@@ -1,4 +1,7 @@
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 logger = logging.getLogger(__name__)
 
@@ -6,11 +9,24 @@ logger = logging.getLogger(__name__)
 def setup_logger() -> None:
     """
     Set up the logger.
+
+    Records are pushed to a queue and written by a background listener
+    thread, so log formatting and I/O stay off the request path.
     """
+    # skip collecting process/thread info for every record
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+
     logger.setLevel(logging.DEBUG)
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    queue = SimpleQueue()
+    logger.addHandler(QueueHandler(queue))
+    listener = QueueListener(queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
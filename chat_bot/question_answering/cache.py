@@ -0,0 +1,57 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with TTL expiry, used to short-circuit repeated
+    retrieval and generation work for recently seen queries.
+
+    Args:
+        max_size (int, optional): Maximum number of entries kept before the
+        least recently used one is evicted. Defaults to 2000.
+        ttl_seconds (float, optional): Time in seconds after which an entry
+        expires. Defaults to 600.
+    """
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
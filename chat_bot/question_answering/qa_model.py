@@ -1,11 +1,19 @@
+import asyncio
 import json
+import logging
 import os
-from typing import Any, List, Mapping, Optional
+import shutil
+import threading
+import uuid
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from urllib.parse import quote
 
-import requests
+import faiss
+import httpx
+import numpy as np
 import torch
-import transformers
 from huggingface_hub import snapshot_download
 from langchain import LLMChain, PromptTemplate
 from langchain.embeddings import HuggingFaceInstructEmbeddings
@@ -14,50 +22,184 @@ from langchain.llms.base import LLM
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.vectorstores import FAISS
 from llama_cpp import Llama
-from transformers import AutoModelForCausalLM, AutoTokenizer
 
+try:
+    from semantic_text_splitter import TextSplitter as RustTextSplitter
+except ImportError:
+    RustTextSplitter = None
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+from transformers.utils import is_flash_attn_2_available, is_torch_sdpa_available
+
+from chat_bot.kernels import cosine_topk, utf8_len
 from chat_bot.logger import logger
+from chat_bot.question_answering.cache import QueryCache
 from chat_bot.question_answering.response import Response
 
+CACHE_MAX_SIZE = 2000
+CACHE_TTL_SECONDS = 600
+EMBEDDING_CACHE_SIZE = 4096
+EMBEDDING_BATCH_SIZE = 32
+CHUNK_SIZE = 150
+CHUNK_OVERLAP = 15
+SPLIT_CACHE_DIR = "data/cache"
+# how many extra candidates to fetch per query for the exact re-rank
+RERANK_OVERSAMPLE = 4
+MAX_NEW_TOKENS = 2048
+
 
 def get_text_splits(text_file):
     """Function takes in the text data and returns the
-    splits so for further processing can be done."""
-    with open(text_file, "r") as txt:
-        data = txt.read()
+    splits so for further processing can be done. Splits are cached on
+    disk keyed by a hash of the file content, so repeated startups on
+    the same document skip the splitting work entirely."""
+    data = Path(text_file).read_bytes()
+    cache_path = Path(SPLIT_CACHE_DIR) / f"splits_{blake2b(data).hexdigest()}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text())
+
+    text = data.decode("utf-8")
+    if RustTextSplitter is not None:
+        # the Rust-backed splitter runs the chunking loop in compiled code
+        splitter = RustTextSplitter(CHUNK_SIZE, overlap=CHUNK_OVERLAP)
+        doc_list = splitter.chunks(text)
+    else:
+        textSplit = RecursiveCharacterTextSplitter(
+            chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP, length_function=utf8_len
+        )
+        doc_list = textSplit.split_text(text)
 
-    textSplit = RecursiveCharacterTextSplitter(
-        chunk_size=150, chunk_overlap=15, length_function=len
-    )
-    doc_list = textSplit.split_text(data)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(doc_list))
     return doc_list
 
 
-def embed_index(doc_list, embed_fn, index_store):
-    """Function takes in existing vector_store,
-    new doc_list and embedding function that is
+def build_ann_index(index, index_factory: str):
+    """Function rebuilds a flat FAISS index with the structure described
+    by the given factory string (e.g. "HNSW32" or "IVF256,PQ32") so that
+    searches run sub-linearly instead of scanning every vector. Returns
+    the original index when no factory is given or when there are not
+    enough vectors to train the new one."""
+    if not index_factory or index.ntotal == 0:
+        return index
+    vectors = index.reconstruct_n(0, index.ntotal)
+    ann_index = faiss.index_factory(index.d, index_factory, faiss.METRIC_L2)
+    if not ann_index.is_trained:
+        # IVF indexes need at least nlist vectors to train their clusters;
+        # scalar quantizers train on any amount of data
+        ivf = faiss.try_extract_index_ivf(ann_index)
+        if ivf is not None and index.ntotal < ivf.nlist:
+            logger.warning(
+                f"Not enough vectors ({index.ntotal}) to train a "
+                f"{index_factory} index, keeping the flat index"
+            )
+            return index
+        ann_index.train(vectors)
+    ann_index.add(vectors)
+    if hasattr(ann_index, "nprobe"):
+        ann_index.nprobe = 8
+    return ann_index
+
+
+def supports_reconstruct(index) -> bool:
+    """Probes once whether the index can reconstruct stored vectors,
+    which some ANN index types only support with extra preprocessing."""
+    if index.ntotal == 0:
+        return False
+    try:
+        index.reconstruct(0)
+        return True
+    except RuntimeError:
+        return False
+
+
+def save_index(faiss_db, index_store) -> None:
+    """Persists the index to a temporary directory and atomically swaps
+    it into place, so an interrupted write can never leave a truncated
+    index behind for the next startup to load."""
+    tmp_store = f"{index_store}.tmp"
+    faiss_db.save_local(tmp_store)
+    if os.path.exists(index_store):
+        shutil.rmtree(index_store)
+    os.replace(tmp_store, index_store)
+    logger.info("Index saved")
+
+
+def embed_index(doc_list, embed_fn, index_store, index_factory: str = ""):
+    """Function takes in new doc_list and embedding function that is
     initialized on appropriate model. Local or online.
-    New embedding is merged with the existing index. If no
-    index given a new one is created"""
+    A fresh index is built for the documents and replaces any existing
+    store on disk - merging would duplicate every chunk of a re-embedded
+    document, and faiss does not implement merge for ANN index types
+    such as HNSW. The built index is returned in memory and persisted to
+    disk from a background thread."""
     # check whether the doc_list is documents, or text
-    try:
-        faiss_db = FAISS.from_documents(doc_list, embed_fn)
-    except Exception as e:
-        faiss_db = FAISS.from_texts(doc_list, embed_fn)
+    builder = (
+        FAISS.from_documents
+        if doc_list and hasattr(doc_list[0], "page_content")
+        else FAISS.from_texts
+    )
+    faiss_db = builder(doc_list, embed_fn)
+    faiss_db.index = build_ann_index(faiss_db.index, index_factory)
 
-    if os.path.exists(index_store):
-        local_db = FAISS.load_local(index_store, embed_fn)
-        # merging the new embedding with the existing index store
-        local_db.merge_from(faiss_db)
-        print("Merge completed")
-        local_db.save_local(index_store)
-        print("Updated index saved")
-    else:
-        faiss_db.save_local(folder_path=index_store)
-        print("New store created...")
+    # the in-memory index is usable right away, persist in the background
+    threading.Thread(
+        target=save_index, args=(faiss_db, index_store), daemon=True
+    ).start()
+    return faiss_db
+
+
+class CachedInstructEmbeddings(HuggingFaceInstructEmbeddings):
+    """
+    Instruct embeddings with a cache over repeated queries and a batched
+    encode path, so the embedding model runs once per distinct query and
+    concurrent queries share a single forward pass.
+    """
+
+    query_cache: Any = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.query_cache = QueryCache(
+            max_size=EMBEDDING_CACHE_SIZE, ttl_seconds=CACHE_TTL_SECONDS
+        )
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_queries([text])[0]
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embeds all uncached queries in one batched encode call."""
+        texts = [text.strip() for text in texts]
+        vectors = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self.query_cache.get(text)
+            if cached is None:
+                missing.append(text)
+            else:
+                vectors[text] = cached
+        if missing:
+            instruction_pairs = [[self.query_instruction, text] for text in missing]
+            with torch.inference_mode():
+                embeddings = self.client.encode(
+                    instruction_pairs,
+                    batch_size=EMBEDDING_BATCH_SIZE,
+                    convert_to_numpy=True,
+                )
+            for text, embedding in zip(missing, embeddings):
+                embedding = embedding.tolist()
+                self.query_cache.put(text, embedding)
+                vectors[text] = embedding
+        return [vectors[text] for text in texts]
 
 
 class LocalBinaryModel(LLM):
+    """
+    LLM backed by a local binary run through llama.cpp. Decoding is
+    memory-bandwidth-bound, so use a Q4_K_M quantized GGUF for the best
+    speed/quality trade-off: convert the checkpoint with llama.cpp's
+    convert.py, then ./quantize model.gguf model.Q4_K_M.gguf Q4_K_M.
+    """
+
     model_id: str = None
     llm: Llama = None
 
@@ -67,7 +209,19 @@ class LocalBinaryModel(LLM):
         if not os.path.exists(model_path):
             raise ValueError(f"{model_path} does not exist")
         self.model_id = model_id
-        self.llm = Llama(model_path=model_path, n_ctx=4096)
+        cpu_count = os.cpu_count() or 1
+        self.llm = Llama(
+            model_path=model_path,
+            n_ctx=4096,
+            # decoding is bandwidth-bound, oversubscribing cores hurts it;
+            # prompt processing is compute-bound and can use them all
+            n_threads=max(cpu_count // 2, 1),
+            n_threads_batch=cpu_count,
+            n_gpu_layers=-1,
+            n_batch=512,
+            use_mmap=True,
+            use_mlock=False,
+        )
 
     def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
         prompt = f"Q: {prompt} A: "
@@ -75,6 +229,12 @@ class LocalBinaryModel(LLM):
         output_text = output["choices"][0]["text"]
         return output_text
 
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        # llama.cpp releases the GIL while evaluating, so inference can run
+        # in a worker thread without blocking the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._call, prompt, stop)
+
     @property
     def _identifying_params(self) -> Mapping[str, Any]:
         return {"name_of_model": self.model_id}
@@ -86,32 +246,148 @@ class LocalBinaryModel(LLM):
 
 class TransformersPipelineModel(LLM):
     model_id: str = None
-    pipeline: str = None
+    tokenizer: Any = None
+    model: Any = None
 
     def __init__(self, model_id: str = None):
         super().__init__()
         self.model_id = model_id
 
         tokenizer = AutoTokenizer.from_pretrained(model_id)
-        model = AutoModelForCausalLM.from_pretrained(
-            model_id,
-            torch_dtype=torch.bfloat16,
-            trust_remote_code=True,
-            load_in_8bit=False,
-            device_map="auto",
-            resume_download=True,
+        # left padding keeps the generated tokens contiguous when several
+        # prompts of different lengths are batched together
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token_id is None:
+            tokenizer.pad_token = tokenizer.eos_token
+        if is_flash_attn_2_available():
+            attn_implementation = "flash_attention_2"
+        elif is_torch_sdpa_available():
+            attn_implementation = "sdpa"
+        else:
+            # explicitly requesting sdpa on a torch build without it raises
+            attn_implementation = "eager"
+        load_kwargs = {
+            "trust_remote_code": True,
+            "device_map": "auto",
+            "resume_download": True,
+            "attn_implementation": attn_implementation,
+        }
+        if torch.cuda.is_available():
+            # 4-bit NF4 weights quarter the bytes moved per decode step,
+            # the dominant cost on bandwidth-bound GPUs
+            load_kwargs["quantization_config"] = BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=torch.bfloat16,
+                bnb_4bit_use_double_quant=True,
+            )
+        else:
+            load_kwargs["torch_dtype"] = torch.bfloat16
+        model = AutoModelForCausalLM.from_pretrained(model_id, **load_kwargs)
+        # a static KV cache is required for the compiled decoding path, but
+        # only some architectures support it; generate raises for the rest
+        if hasattr(model, "_setup_cache"):
+            model.generation_config.cache_implementation = "static"
+        model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+        self.tokenizer = tokenizer
+        self.model = model
+        # warm up so compilation happens at startup, not on the first request
+        self._generate(["Hello"], max_new_tokens=1)
+
+    def _generate(
+        self, prompts: List[str], max_new_tokens: int = MAX_NEW_TOKENS
+    ) -> List[str]:
+        """Tokenizes the prompts once, drives model.generate directly and
+        slices the prompt tokens off by length, avoiding the pipeline's
+        re-tokenization and full-string replace per call."""
+        encoding = self.tokenizer(prompts, return_tensors="pt", padding=True).to(
+            self.model.device
+        )
+        with torch.inference_mode():
+            output = self.model.generate(
+                **encoding,
+                max_new_tokens=max_new_tokens,
+                do_sample=False,
+                use_cache=True,
+            )
+        generated = output[:, encoding.input_ids.shape[1] :]
+        return self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        return self._generate([prompt])[0]
+
+    def batched_call(self, prompts: List[str]) -> List[str]:
+        """
+        Generates answers for multiple prompts in a single forward pass,
+        so concurrent requests share one batched generate call instead of
+        running the model once per prompt.
+        """
+        return self._generate(prompts)
+
+    @property
+    def _identifying_params(self) -> Mapping[str, Any]:
+        return {"name_of_model": self.model_id}
+
+    @property
+    def _llm_type(self) -> str:
+        return self.model_id
+
+
+class VLLMModel(LLM):
+    """
+    LLM served by a vLLM AsyncLLMEngine. The engine batches concurrent
+    requests continuously with paged KV cache, so it replaces both the
+    HF pipeline and the external micro-batching layer.
+    """
+
+    model_id: str = None
+    engine: Any = None
+    loop: Any = None
+
+    def __init__(self, model_id: str = None):
+        super().__init__()
+        try:
+            from vllm import AsyncEngineArgs, AsyncLLMEngine
+        except ImportError:
+            raise ValueError(
+                "vllm is not installed, it is required for vllm/ model ids"
+            )
+        self.model_id = model_id
+        engine_args = AsyncEngineArgs(
+            model=model_id,
+            dtype="bfloat16",
+            gpu_memory_utilization=0.9,
+            max_num_batched_tokens=4096,
         )
-        self.pipeline = transformers.pipeline(
-            "text-generation",
-            model=model,
-            tokenizer=tokenizer,
-            max_new_tokens=2048,
+        self.engine = AsyncLLMEngine.from_engine_args(engine_args)
+        # the engine binds its background task to the first event loop that
+        # drives it, so every call is routed through one dedicated loop that
+        # stays alive for the engine's lifetime
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    async def _generate(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        from vllm import SamplingParams
+
+        sampling_params = SamplingParams(max_tokens=2048, stop=stop)
+        output = None
+        async for request_output in self.engine.generate(
+            prompt, sampling_params, request_id=str(uuid.uuid4())
+        ):
+            output = request_output
+        return output.outputs[0].text
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        future = asyncio.run_coroutine_threadsafe(
+            self._generate(prompt, stop), self.loop
         )
+        return await asyncio.wrap_future(future)
 
     def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
-        output_text = self.pipeline(prompt)[0]["generated_text"]
-        output_text = output_text.replace(prompt + "\n", "")
-        return output_text
+        future = asyncio.run_coroutine_threadsafe(
+            self._generate(prompt, stop), self.loop
+        )
+        return future.result()
 
     @property
     def _identifying_params(self) -> Mapping[str, Any]:
@@ -126,6 +402,8 @@ class APIServedModel(LLM):
     model_url: str = None
     debug: bool = None
     headers: dict = None
+    client: Any = None
+    async_client: Any = None
 
     def __init__(self, model_url: str = None, headers: dict = None, debug: bool = None):
         super().__init__()
@@ -134,20 +412,44 @@ class APIServedModel(LLM):
         self.model_url = model_url
         self.debug = debug
         self.headers = headers
+        # pooled clients reuse connections across calls instead of paying
+        # a TCP+TLS handshake per request
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        self.client = httpx.Client(timeout=60, limits=limits, headers=headers)
+        self.async_client = httpx.AsyncClient(
+            http2=True, timeout=60, limits=limits, headers=headers
+        )
 
     def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
         if self.debug:
-            logger.info(f"URL: {self.model_url}")
+            logger.info("URL: %s", self.model_url)
+        try:
+            response = self.client.post(self.model_url, json={"inputs": prompt})
+            response.raise_for_status()
+            output = response.json()
+            if self.debug:
+                for resp in output:
+                    logger.info(resp)
+            return output[0]["generated_text"]
+        except Exception as err:
+            logger.error("Error: %s", err)
+            return f"Error: {err}"
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        if self.debug:
+            logger.info("URL: %s", self.model_url)
         try:
-            response = requests.post(
-                self.model_url, headers=self.headers, json={"inputs": prompt}
+            response = await self.async_client.post(
+                self.model_url, json={"inputs": prompt}
             )
             response.raise_for_status()
-            for resp in response.json():
-                logger.info(resp)
-            return response.json()[0]["generated_text"]
+            output = response.json()
+            if self.debug:
+                for resp in output:
+                    logger.info(resp)
+            return output[0]["generated_text"]
         except Exception as err:
-            logger.error(f"Error: {err}")
+            logger.error("Error: %s", err)
             return f"Error: {err}"
 
     @property
@@ -196,6 +498,8 @@ class QAModel:
         add_sources_to_response: bool = True,
         use_messages_for_context: bool = True,
         num_relevant_docs: int = 3,
+        index_factory: str = "",
+        faiss_on_gpu: bool = False,
         debug: bool = False,
     ):
         super().__init__()
@@ -203,13 +507,24 @@ class QAModel:
         self.add_sources_to_response = add_sources_to_response
         self.use_messages_for_context = use_messages_for_context
         self.num_relevant_docs = num_relevant_docs
+        self.index_factory = index_factory
+        self.faiss_on_gpu = faiss_on_gpu
         self.debug = debug
         self.api_token = api_token
         self.embedding_model_id = embedding_model_id
+        self.answer_cache = QueryCache(
+            max_size=CACHE_MAX_SIZE, ttl_seconds=CACHE_TTL_SECONDS
+        )
+        self.retrieval_cache = QueryCache(
+            max_size=CACHE_MAX_SIZE, ttl_seconds=CACHE_TTL_SECONDS
+        )
 
         if "local_models/" in llm_model_id:
             logger.info("using local binary model")
             self.llm_model = LocalBinaryModel(model_id=llm_model_id)
+        elif llm_model_id.startswith("vllm/"):
+            logger.info("using vllm engine")
+            self.llm_model = VLLMModel(model_id=llm_model_id.replace("vllm/", ""))
         elif "api_models/" in llm_model_id:
             logger.info("using api served model")
             self.llm_model = APIServedModel(
@@ -228,10 +543,10 @@ class QAModel:
             "{context}\n### Input:\n{question}\n### Response:"
         )
 
-        prompt = PromptTemplate(
+        self.prompt = PromptTemplate(
             template=prompt_template, input_variables=["question", "context"]
         )
-        self.llm_chain = LLMChain(prompt=prompt, llm=self.llm_model)
+        self.llm_chain = LLMChain(prompt=self.prompt, llm=self.llm_model)
 
         if self.use_docs_for_context:
             file_name = "owl_events.txt"
@@ -248,32 +563,161 @@ class QAModel:
             file_path (str): the file path of the docuemnt to be embeded.
         """
         file_name = file_path.split("/")[-1].split(".")[0]
-        logger.info("Splitting text...")
-        doc_list = get_text_splits(file_path)
+        index_store = f"data/embeddings/{file_name}"
         logger.info("Loading embedding model...")
         embed_instruction = f"Represent the {doc_title}"
         query_instruction = (
             f"Query the most relevant piece of information from the {doc_title}"
         )
-        embedding_model = HuggingFaceInstructEmbeddings(
+        embedding_model = CachedInstructEmbeddings(
             model_name=self.embedding_model_id,
             embed_instruction=embed_instruction,
             query_instruction=query_instruction,
         )
+        self.embedding_model = embedding_model
         logger.info("Embedding model loaded")
-        logger.info("Embedding doc...")
 
-        embed_index(
-            doc_list=doc_list,
-            embed_fn=embedding_model,
-            index_store=f"data/embeddings/{file_name}",
+        index_file = f"{index_store}/index.faiss"
+        if os.path.exists(index_file) and os.path.getmtime(
+            index_file
+        ) >= os.path.getmtime(file_path):
+            # the stored index is newer than the document, reuse it
+            logger.info("Loading index...")
+            self.knowledge_index = FAISS.load_local(index_store, embedding_model)
+            logger.info("Index loaded")
+        else:
+            logger.info("Splitting text...")
+            doc_list = get_text_splits(file_path)
+            logger.info("Embedding doc...")
+            self.knowledge_index = embed_index(
+                doc_list=doc_list,
+                embed_fn=embedding_model,
+                index_store=index_store,
+                index_factory=self.index_factory,
+            )
+            logger.info("Index ready")
+
+        if self.faiss_on_gpu and torch.cuda.is_available():
+            if isinstance(self.knowledge_index.index, faiss.IndexHNSW):
+                # index_cpu_to_gpu cannot clone HNSW graphs
+                logger.warning(
+                    "HNSW indexes cannot be moved to GPU, keeping the index on "
+                    "CPU; use a flat or IVF FAISS_INDEX_FACTORY with FAISS_ON_GPU"
+                )
+            elif hasattr(faiss, "StandardGpuResources"):
+                logger.info("Moving FAISS index to GPU")
+                # the resources object must outlive the GPU index
+                self._gpu_resources = faiss.StandardGpuResources()
+                self.knowledge_index.index = faiss.index_cpu_to_gpu(
+                    self._gpu_resources, 0, self.knowledge_index.index
+                )
+            else:
+                logger.warning("faiss-gpu is not installed, keeping the index on CPU")
+        self._index_supports_reconstruct = supports_reconstruct(
+            self.knowledge_index.index
         )
 
-        logger.info("Loading index...")
-        self.knowledge_index = FAISS.load_local(
-            f"data/embeddings/{file_name}", embedding_model
+    def retrieve_batch(self, queries: List[str], k: int) -> List[List]:
+        """
+        Retrieves relevant documents for several queries with a single
+        FAISS search call, so the distance computation runs as one large
+        matrix product instead of one small search per query.
+
+        Args:
+            queries (List[str]): The queries to search for.
+            k (int): The number of documents to retrieve per query.
+
+        Returns:
+            results (List[List]): The retrieved documents, one list per query.
+        """
+        store = self.knowledge_index
+        vectors = np.array(
+            self.embedding_model.embed_queries(queries), dtype=np.float32
         )
-        logger.info("Index loaded")
+        fetch_k = min(k * RERANK_OVERSAMPLE, store.index.ntotal)
+        _, indices = store.index.search(vectors, fetch_k)
+        results = []
+        for query_vector, row in zip(vectors, indices):
+            ids = [int(idx) for idx in row if idx != -1]
+            if self._index_supports_reconstruct and len(ids) > k:
+                # exact cosine re-rank over the oversampled ANN candidates
+                candidates = np.stack(
+                    [store.index.reconstruct(idx) for idx in ids]
+                ).astype(np.float32)
+                ids = [ids[i] for i in cosine_topk(query_vector, candidates, k)]
+            else:
+                ids = ids[:k]
+            docs = [
+                store.docstore.search(store.index_to_docstore_id[idx]) for idx in ids
+            ]
+            results.append(docs)
+        return results
+
+    def _build_context(self, question: str, messages_context: str) -> Tuple[str, List]:
+        """
+        Builds the context for the question from previous messages and
+        relevant documents.
+
+        Args:
+            question (str): The question to be answered.
+            messages_context (str): The previous messages of the conversation.
+
+        Returns:
+            context (str): The context to be passed to the prompt template.
+            relevant_docs (List): The documents retrieved from the index.
+        """
+        # collect the pieces and join once at the end - repeated string
+        # concatenation goes quadratic as the context grows
+        parts = [
+            "Give an answer that contains all the necessary information for the question.\n"
+        ]
+        relevant_docs = ""
+        if self.use_messages_for_context and messages_context:
+            messages_context = f"\nPrevious questions and answers:\n{messages_context}"
+            parts.append(messages_context)
+        if self.use_docs_for_context:
+            query = messages_context + question
+            cache_key = blake2b(query.encode()).digest()
+            relevant_docs = self.retrieval_cache.get(cache_key)
+            if relevant_docs is None:
+                logger.info("Retriving documents")
+                relevant_docs = self.retrieve_batch(
+                    queries=[query], k=self.num_relevant_docs
+                )[0]
+                self.retrieval_cache.put(cache_key, relevant_docs)
+            parts.append("\nExtracted documents:\n")
+            parts.append("\n".join(doc.page_content for doc in relevant_docs))
+            # metadata = [doc.metadata for doc in relevant_docs]
+            # response.set_sources(sources=[str(m["source"]) for m in metadata])
+        return "".join(parts), relevant_docs
+
+    def answer_cache_key(self, question: str, messages_context: str = "") -> bytes:
+        """Cache key covering everything that influences the answer."""
+        return blake2b(
+            f"{question}\x00{messages_context}\x00{self.num_relevant_docs}".encode()
+        ).digest()
+
+    def cache_stats(self) -> Dict:
+        """Returns hit/miss statistics for the answer and retrieval caches."""
+        return {
+            "answer_cache": self.answer_cache.stats(),
+            "retrieval_cache": self.retrieval_cache.stats(),
+        }
+
+    def get_prompt(self, question: str, messages_context: str = "") -> str:
+        """
+        Builds the full prompt for the question, ready to be passed to the
+        LLM directly, e.g. as part of a batched call.
+
+        Args:
+            question (str): The question to be answered.
+            messages_context (str, optional): The context to be used for generating the answer. Defaults to ''.
+
+        Returns:
+            prompt (str): The formatted prompt.
+        """
+        context, _ = self._build_context(question, messages_context)
+        return self.prompt.format(question=question, context=context)
 
     def get_answer(self, question: str, messages_context: str = "") -> Response:
         """
@@ -288,37 +732,73 @@ class QAModel:
             used to generate the response.
         """
 
+        cache_key = self.answer_cache_key(question, messages_context)
+        response = self.answer_cache.get(cache_key)
+        if response is not None:
+            return response
+
         response = Response()
-        context = "Give an answer that contains all the necessary information for the question.\n"
-        relevant_docs = ""
-        if self.use_messages_for_context and messages_context:
-            messages_context = f"\nPrevious questions and answers:\n{messages_context}"
-            context += messages_context
-        if self.use_docs_for_context:
-            logger.info("Retriving documents")
-            relevant_docs = self.knowledge_index.similarity_search(
-                query=messages_context + question, k=self.num_relevant_docs
-            )
-            context += "\nExtracted documents:\n"
-            context += "\n".join([doc.page_content for doc in relevant_docs])
-            # metadata = [doc.metadata for doc in relevant_docs]
-            # response.set_sources(sources=[str(m["source"]) for m in metadata])
+        context, relevant_docs = self._build_context(question, messages_context)
 
-        logger.info("Running LLM chain")
-        answer = self.llm_chain.run(question=question, context=context)
+        logger.info("Running LLM")
+        if self.debug:
+            # keep the chain in debug mode for its callback traces
+            answer = self.llm_chain.run(question=question, context=context)
+        else:
+            # format the template and call the model directly, skipping the
+            # per-call chain and callback-manager machinery
+            prompt = self.prompt.format(question=question, context=context)
+            answer = self.llm_model._call(prompt)
         response.set_answer(answer)
+        self.answer_cache.put(cache_key, response)
         logger.info("Received answer")
 
-        if self.debug:
+        if self.debug and logger.isEnabledFor(logging.DEBUG):
             sep = "\n" + "-" * 100
             logger.info(sep)
-            logger.info(f"messages_contex: {messages_context} {sep}")
-            logger.info(f"relevant_docs: {relevant_docs} {sep}")
-            sources_str = "\n".join(response.get_sources())
-            logger.info(f"sources:\n{sources_str} {sep}")
-            logger.info(f"context len: {len(context)} {sep}")
-            logger.info(f"context: {context} {sep}")
-            logger.info(f"question len: {len(question)}")
-            logger.info(f"question: {question} {sep}")
-            logger.info(f"response: {response.get_answer()} {sep}")
+            logger.info("messages_contex: %s %s", messages_context, sep)
+            logger.info("relevant_docs: %s %s", relevant_docs, sep)
+            logger.info("sources:\n%s %s", "\n".join(response.get_sources()), sep)
+            logger.info("context len: %d %s", len(context), sep)
+            logger.info("context: %s %s", context, sep)
+            logger.info("question len: %d", len(question))
+            logger.info("question: %s %s", question, sep)
+            logger.info("response: %s %s", response.get_answer(), sep)
+        return response
+
+    async def aget_answer(self, question: str, messages_context: str = "") -> Response:
+        """
+        Async variant of get_answer. Embedding and retrieval run in a
+        worker thread while the event loop keeps serving other requests,
+        and generation awaits the backend's native async path when it has
+        one, so concurrent in-flight answers overlap instead of queueing.
+
+        Args:
+            question (str): The question to be answered.
+            messages_context (str, optional): The context to be used for generating the answer. Defaults to ''.
+
+        Returns:
+            response (Response): The Response object containing the generated answer and the sources of information
+            used to generate the response.
+        """
+        cache_key = self.answer_cache_key(question, messages_context)
+        response = self.answer_cache.get(cache_key)
+        if response is not None:
+            return response
+
+        loop = asyncio.get_running_loop()
+        response = Response()
+        context, _ = await loop.run_in_executor(
+            None, self._build_context, question, messages_context
+        )
+        prompt = self.prompt.format(question=question, context=context)
+
+        logger.info("Running LLM")
+        if "_acall" in type(self.llm_model).__dict__:
+            answer = await self.llm_model._acall(prompt)
+        else:
+            answer = await loop.run_in_executor(None, self.llm_model._call, prompt)
+        response.set_answer(answer)
+        self.answer_cache.put(cache_key, response)
+        logger.info("Received answer")
         return response
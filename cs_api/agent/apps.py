@@ -1,9 +1,19 @@
+import sys
+
 from django.apps import AppConfig
 
+# management commands that never save an Agent and don't need the handlers
+SIGNAL_FREE_COMMANDS = {"makemigrations", "migrate", "collectstatic", "shell"}
+
 
 class AgentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "agent"
 
     def ready(self):
+        # importing the signals module connects the handlers and pulls in
+        # jwt and the models, which slows down every manage.py invocation;
+        # skip it for commands that cannot trigger the handlers
+        if len(sys.argv) > 1 and sys.argv[1] in SIGNAL_FREE_COMMANDS:
+            return
         import agent.signals  # noqa: F401
@@ -1,7 +1,6 @@
 from authentication.permissions import IsAdmin
-from rest_framework import generics, status
+from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 
 from .models import AccessToken, Agent, SuperPower
 from .serializers import AccessTokenSerializer, AgentSerializer, SuperPowerSerializer
@@ -20,30 +19,29 @@ class AgentList(generics.ListCreateAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        if user.role in ["ADMIN"]:
-            return Agent.objects.all().order_by("-id")
-        return Agent.objects.filter(owner=user).order_by("-id")
-
-    def create(self, request, *args, **kwargs):
-        serializer = self.serializer_class(
-            data=request.data, context={"request": request}
+        queryset = Agent.objects.all()
+        if user.role not in ["ADMIN"]:
+            queryset = queryset.filter(owner=user)
+        # join the owner and prefetch super powers so listing stays at a
+        # constant number of queries, and fetch only the serialized columns
+        return (
+            queryset.select_related("owner")
+            .prefetch_related("super_powers")
+            .only(
+                "id",
+                "name",
+                "description",
+                "created_at",
+                "updated_at",
+                "owner__id",
+                "owner__username",
+                "owner__email",
+            )
+            .order_by("-id")
         )
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 class SuperPowerList(generics.ListCreateAPIView):
     queryset = SuperPower.objects.all().order_by("-id")
     serializer_class = SuperPowerSerializer
     permission_classes = []
-
-    def create(self, request, *args, **kwargs):
-        serializer = self.serializer_class(
-            data=request.data, context={"request": request}
-        )
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,44 @@
+import time
+
+from chat_bot.question_answering.cache import QueryCache
+
+
+def test_get_and_put():
+    cache = QueryCache(max_size=2, ttl_seconds=60)
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+
+
+def test_miss_returns_none():
+    cache = QueryCache(max_size=2, ttl_seconds=60)
+    assert cache.get("missing") is None
+
+
+def test_ttl_expiry():
+    cache = QueryCache(max_size=2, ttl_seconds=0.01)
+    cache.put("key", "value")
+    time.sleep(0.02)
+    assert cache.get("key") is None
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_size=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_stats():
+    cache = QueryCache(max_size=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,61 @@
+import asyncio
+
+from chat_bot.batcher import PromptBatcher
+
+
+class EchoLLM:
+    def __init__(self):
+        self.calls = []
+
+    def batched_call(self, prompts):
+        self.calls.append(list(prompts))
+        return [prompt.upper() for prompt in prompts]
+
+
+class FailingLLM:
+    def batched_call(self, prompts):
+        raise RuntimeError("model exploded")
+
+
+def test_batches_concurrent_prompts():
+    llm = EchoLLM()
+
+    async def scenario():
+        batcher = PromptBatcher(llm, max_batch_size=4, max_wait_ms=50)
+        task = asyncio.create_task(batcher.run())
+        answers = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), batcher.submit("c")
+        )
+        task.cancel()
+        return answers
+
+    assert asyncio.run(scenario()) == ["A", "B", "C"]
+    assert len(llm.calls) == 1
+
+
+def test_respects_max_batch_size():
+    llm = EchoLLM()
+
+    async def scenario():
+        batcher = PromptBatcher(llm, max_batch_size=1, max_wait_ms=50)
+        task = asyncio.create_task(batcher.run())
+        answers = await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+        task.cancel()
+        return answers
+
+    assert asyncio.run(scenario()) == ["A", "B"]
+    assert all(len(call) == 1 for call in llm.calls)
+
+
+def test_errors_propagate_to_all_waiters():
+    async def scenario():
+        batcher = PromptBatcher(FailingLLM(), max_batch_size=4, max_wait_ms=50)
+        task = asyncio.create_task(batcher.run())
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        task.cancel()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)